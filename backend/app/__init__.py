@@ -3,18 +3,37 @@ from flask_cors import CORS
 from app.config import Config
 from app.routes.context_engine import bp as context_bp
 from app.routes.resume import bp as resume_bp
+from app.routes.revisions import bp as revisions_bp
+from app.services.pdf_prerenderer import PdfPrerenderer
+from app.services.revision_store import RevisionStore
 
-def create_app():
+def create_app(config_overrides=None):
     app = Flask(__name__)
 
     # Load config
     app.config.from_object(Config)
+    if config_overrides:
+        app.config.update(config_overrides)
+
+    # Shared services
+    app.extensions['revision_store'] = RevisionStore(
+        app.config['REVISION_STORE_PATH'],
+        retention_seconds=app.config['REVISION_RETENTION_DAYS'] * 24 * 3600,
+    )
+    app.extensions['pdf_prerenderer'] = PdfPrerenderer(
+        enabled=app.config['PDF_PRERENDER_ENABLED'],
+        idle_seconds=app.config['PDF_PRERENDER_IDLE_SECONDS'],
+        max_workers=app.config['PDF_PRERENDER_MAX_WORKERS'],
+        cache_size=app.config['PDF_PRERENDER_CACHE_SIZE'],
+        wait_seconds=app.config['PDF_PRERENDER_WAIT_SECONDS'],
+    )
 
     # Enable CORS
-    CORS(app)
+    CORS(app, expose_headers=['X-Revision-Id'])
 
     # Register blueprints
     app.register_blueprint(context_bp)
     app.register_blueprint(resume_bp)
+    app.register_blueprint(revisions_bp)
 
     return app
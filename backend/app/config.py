@@ -4,3 +4,15 @@ class Config:
     DEBUG = True
     SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret")
     LLM_API_KEY = os.environ.get("LLM_API_KEY", "dummy-key")
+    REVISION_STORE_PATH = os.environ.get(
+        "REVISION_STORE_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "revisions.db"),
+    )
+    REVISION_RETENTION_DAYS = float(os.environ.get("REVISION_RETENTION_DAYS", "30"))
+    # Speculative PDF pre-rendering after a workspace stops changing (opt-in)
+    PDF_PRERENDER_ENABLED = os.environ.get("PDF_PRERENDER_ENABLED", "false").lower() in ("1", "true", "yes")
+    PDF_PRERENDER_IDLE_SECONDS = float(os.environ.get("PDF_PRERENDER_IDLE_SECONDS", "5"))
+    PDF_PRERENDER_MAX_WORKERS = int(os.environ.get("PDF_PRERENDER_MAX_WORKERS", "1"))
+    PDF_PRERENDER_CACHE_SIZE = int(os.environ.get("PDF_PRERENDER_CACHE_SIZE", "16"))
+    # How long an export waits for a running speculative build before building itself
+    PDF_PRERENDER_WAIT_SECONDS = float(os.environ.get("PDF_PRERENDER_WAIT_SECONDS", "10"))
@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 import os
 import json
 from PyPDF2 import PdfReader
+from app.services.revision_store import RevisionNotFoundError, get_revision_store
 
 # TODO: update to /api/context
 bp = Blueprint("context_engine", __name__, url_prefix="")
@@ -24,12 +25,19 @@ def ai_edit():
     target_path = request.json.get('targetPath')
     element_selector = request.json.get('selector')
     instruction = request.json.get('instruction')
-    files = request.json.get('files', [])
     
     # Validate required fields
-    if not all([target_path, instruction, files]):
+    if not all([target_path, instruction]) or not (request.json.get('files') or request.json.get('revisionId')):
         return jsonify({'error': 'Missing required fields'}), 400
     
+    revision_store = get_revision_store()
+    try:
+        revision_id, files = revision_store.checkout(request.json, persist=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+    
     # Ensure we have a valid selector
     if not element_selector:
         element_selector = 'body'
@@ -163,9 +171,15 @@ def ai_edit():
             else:
                 updated_files.append(f)
         
+        # Keep the edit as a new revision on top of the one it was made against
+        new_revision_id = revision_store.create_revision(
+            [{**target_file, 'content': result}], base_id=revision_id
+        )
+        
         return jsonify({
             'success': True,
-            'updatedFiles': updated_files
+            'updatedFiles': updated_files,
+            'revisionId': new_revision_id
         })
         
     except Exception as e:
@@ -192,16 +206,30 @@ def upload_resume():
     
     model = request.form.get('model', 'gpt-3.5-turbo-0125')
     
-    # Get files JSON data
+    # Get files JSON data, optionally as changes on top of a stored revision
     files_json = request.form.get('files')
-    if not files_json:
+    base_revision_id = request.form.get('revisionId')
+    if not files_json and not base_revision_id:
         return jsonify({'error': 'Files data is required'}), 400
     
     try:
-        files = json.loads(files_json)
+        files = json.loads(files_json) if files_json else []
+        deleted = json.loads(request.form.get('deleted') or '[]')
     except Exception as e:
         return jsonify({'error': f'Invalid files data: {str(e)}'}), 400
     
+    revision_store = get_revision_store()
+    try:
+        revision_id, files = revision_store.checkout({
+            'files': files,
+            'revisionId': base_revision_id,
+            'deleted': deleted
+        }, persist=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+    
     # Find the resume HTML file (assumes it's index.html)
     resume_file = next((f for f in files if f['path'] == 'index.html'), None)
     if not resume_file:
@@ -339,7 +367,18 @@ def upload_resume():
         else:
             updated_files.append(f)
     
+    try:
+        new_revision_id = revision_store.create_revision(
+            [{**resume_file, 'content': result}], base_id=revision_id
+        )
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to store revision',
+            'details': str(e)
+        }), 500
+    
     return jsonify({
         'success': True,
-        'updatedFiles': updated_files
+        'updatedFiles': updated_files,
+        'revisionId': new_revision_id
     })
@@ -1,6 +1,8 @@
 from io import BytesIO
 from flask import Blueprint, request, jsonify, send_file
 from app.services.resume_service import ResumeService
+from app.services.pdf_prerenderer import get_pdf_prerenderer
+from app.services.revision_store import RevisionNotFoundError, get_revision_store
 import tempfile
 import shutil
 import os
@@ -13,17 +15,23 @@ resume_service = ResumeService()
 try:
     from weasyprint import HTML, CSS
     WEASYPRINT_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):
     WEASYPRINT_AVAILABLE = False
 
 
 @bp.route('/render', methods=['POST'])
 def render_html():
     """Render HTML with associated CSS files"""
-    if not request.json or 'files' not in request.json:
+    if not request.json or not ('files' in request.json or 'revisionId' in request.json):
         return jsonify({'error': 'No files provided'}), 400
 
-    files = request.json['files']
+    try:
+        revision_id, files = get_revision_store().checkout(request.json)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+
     main_file = request.json.get('mainFile', 'index.html')
     temp_dir = tempfile.mkdtemp()
 
@@ -41,10 +49,18 @@ def render_html():
         # Collect all CSS files
         css_files = {f['path']: f['content'] for f in files if f['path'].endswith('.css')}
 
-        return jsonify({
+        # Prepare the PDF in the background if this workspace stays unchanged
+        workspace_id = request.json.get('workspaceId')
+        if isinstance(workspace_id, str) and workspace_id:
+            get_pdf_prerenderer().schedule(workspace_id, files, main_file)
+
+        result = {
             'html': html_content,
             'css_files': css_files
-        })
+        }
+        if revision_id:
+            result['revisionId'] = revision_id
+        return jsonify(result)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -54,20 +70,36 @@ def render_html():
 @bp.route('/export-pdf', methods=['POST'])
 def export_pdf():
     """Export HTML to PDF using WeasyPrint"""
-    if not request.json or 'files' not in request.json:
+    if not request.json or not ('files' in request.json or 'revisionId' in request.json):
         return jsonify({'error': 'No files provided'}), 400
-    files = request.json['files']
+
+    try:
+        revision_id, files = get_revision_store().checkout(request.json, persist=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+
     main_file = request.json.get('mainFile', 'index.html')
 
     try:
-        pdf_buffer = resume_service.export_pdf(files, main_file)
+        pdf_prerenderer = get_pdf_prerenderer()
+        pdf = pdf_prerenderer.get(files, main_file)
+        if pdf is not None:
+            pdf_buffer = BytesIO(pdf)
+        else:
+            pdf_buffer = resume_service.export_pdf(files, main_file)
+            pdf_prerenderer.put(files, main_file, pdf_buffer.getvalue())
 
-        return send_file(
+        response = send_file(
             pdf_buffer,
             mimetype='application/pdf',
             as_attachment=True,
             download_name='resume.pdf'
         )
+        if revision_id:
+            response.headers['X-Revision-Id'] = revision_id
+        return response
     except Exception as e:
         return jsonify({
             'error': 'PDF generation failed',
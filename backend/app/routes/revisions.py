@@ -0,0 +1,43 @@
+from flask import Blueprint, request, jsonify
+from app.services.revision_store import RevisionNotFoundError, get_revision_store
+
+bp = Blueprint("revisions", __name__, url_prefix="/revisions")
+
+
+@bp.route('', methods=['POST'])
+def create_revision():
+    """Store a workspace (or changes on top of a revision) and return its ID"""
+    if not request.json or not ('files' in request.json or 'revisionId' in request.json):
+        return jsonify({'error': 'No files provided'}), 400
+
+    try:
+        revision_id, _ = get_revision_store().checkout(request.json, persist=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+
+    return jsonify({'revisionId': revision_id})
+
+
+@bp.route('/<revision_id>', methods=['GET'])
+def get_revision(revision_id):
+    """Return the full file list of a revision"""
+    try:
+        files = get_revision_store().get_files(revision_id)
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+
+    return jsonify({'revisionId': revision_id, 'files': files})
+
+
+@bp.route('/<revision_id>/history', methods=['GET'])
+def get_history(revision_id):
+    """Return the ancestry of a revision, newest first"""
+    limit = request.args.get('limit', 50, type=int)
+    try:
+        history = get_revision_store().history(revision_id, limit=limit)
+    except RevisionNotFoundError as e:
+        return jsonify({'error': str(e), 'code': 'revision_not_found'}), 410
+
+    return jsonify({'history': history})
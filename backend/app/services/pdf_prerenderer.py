@@ -0,0 +1,255 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+
+def _lower_priority():
+    """Run pre-render worker processes at a lower scheduling priority than requests."""
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+
+def get_pdf_prerenderer() -> 'PdfPrerenderer':
+    """Return the pre-renderer created for the current app in ``create_app``."""
+    from flask import current_app
+    return current_app.extensions['pdf_prerenderer']
+
+
+def build_pdf(files: list[dict], main_file: str) -> bytes:
+    """Build a PDF in a worker process."""
+    from app.services.resume_service import ResumeService
+    return ResumeService().export_pdf(files, main_file).getvalue()
+
+
+class PdfPrerenderer:
+    """Speculatively builds PDFs for workspaces that have stopped changing.
+
+    Every ``schedule`` call restarts an idle timer for the workspace. If no
+    newer content arrives before it fires, a PDF build is queued for a pool of
+    ``max_workers`` low-priority worker processes, which is the global CPU
+    budget for speculative work; separate processes keep WeasyPrint's layout
+    off the GIL that request threads need. Builds are only handed to the pool
+    when a worker is free, so queued builds stay cancellable. Several
+    workspaces with the same content share one build, which is only dropped
+    once none of them is waiting on it any more. Builds that already started
+    run to completion. Finished PDFs are kept in a bounded LRU keyed by
+    content hash. If a worker dies, the pool is replaced.
+    """
+
+    def __init__(self, enabled: bool = False, idle_seconds: float = 5.0, max_workers: int = 1,
+                 cache_size: int = 16, wait_seconds: float = 10.0,
+                 build: Callable[[list[dict], str], bytes] = build_pdf):
+        self.enabled = enabled
+        self.idle_seconds = idle_seconds
+        self.wait_seconds = wait_seconds
+        self.max_workers = max(1, max_workers)
+        self.cache_size = cache_size
+        self.build = build
+        # Reentrant because done callbacks can run in the thread that submits
+        self._lock = threading.RLock()
+        self._pending: dict[str, str] = {}
+        self._timers: dict[str, threading.Timer] = {}
+        self._waiters: dict[str, set[str]] = {}
+        self._queued: OrderedDict[str, tuple[list[dict], str]] = OrderedDict()
+        self._in_flight: dict[str, Future[bytes]] = {}
+        self._results: OrderedDict[str, bytes] = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Bumped whenever the pool is replaced, so stale failures are ignored
+        self._generation = 0
+        if enabled:
+            self._executor = self._make_executor()
+
+    def _make_executor(self) -> ProcessPoolExecutor:
+        # Worker processes start lazily, on the first submitted build
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            # Forking a multi-threaded server can deadlock the child
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_lower_priority,
+        )
+
+    @staticmethod
+    def content_key(files: list[dict], main_file: str = 'index.html') -> str:
+        """Hash the rendered inputs, independent of file order and metadata."""
+        digest = hashlib.sha256(main_file.encode('utf-8'))
+        for file in sorted(files, key=lambda f: f['path']):
+            digest.update(b'\0' + file['path'].encode('utf-8'))
+            digest.update(b'\0' + file['content'].encode('utf-8'))
+        return digest.hexdigest()
+
+    def schedule(self, workspace_id: str, files: list[dict], main_file: str = 'index.html') -> None:
+        """Note that ``workspace_id`` was rendered with ``files``."""
+        if not self.enabled:
+            return
+
+        key = self.content_key(files, main_file)
+        with self._lock:
+            if self._pending.get(workspace_id) == key:
+                # Unchanged since the last render; let the idle timer run out
+                return
+            self._release(workspace_id)
+            if key in self._results:
+                return
+
+            self._pending[workspace_id] = key
+            self._waiters.setdefault(key, set()).add(workspace_id)
+            if key in self._in_flight or key in self._queued:
+                return
+
+            timer = threading.Timer(self.idle_seconds, self._submit,
+                                    args=(workspace_id, key, files, main_file))
+            timer.daemon = True
+            self._timers[workspace_id] = timer
+            timer.start()
+
+    def get(self, files: list[dict], main_file: str = 'index.html') -> Optional[bytes]:
+        """Return a prepared PDF for this content, or ``None`` to build it on demand.
+
+        Waits up to ``wait_seconds`` for a build of the same content only if
+        it is already running; a build still queued behind other workspaces is
+        dropped instead.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.content_key(files, main_file)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+            if key in self._queued:
+                del self._queued[key]
+                self._forget(key)
+                return None
+            future = self._in_flight.get(key)
+            if future is None:
+                return None
+
+        try:
+            return future.result(timeout=self.wait_seconds)
+        except TimeoutError:
+            print("Speculative PDF build is taking too long; building on demand")
+            return None
+        except Exception:
+            return None
+
+    def state(self, files: list[dict], main_file: str = 'index.html') -> Optional[str]:
+        """Report where a PDF for this content is: ready, running, queued or waiting."""
+        key = self.content_key(files, main_file)
+        with self._lock:
+            if key in self._results:
+                return 'ready'
+            if key in self._in_flight:
+                return 'running'
+            if key in self._queued:
+                return 'queued'
+            if key in self._waiters:
+                return 'waiting'
+        return None
+
+    def put(self, files: list[dict], main_file: str, pdf: bytes) -> None:
+        """Remember a PDF built on demand so repeated exports are instant."""
+        if self.enabled:
+            self._store(self.content_key(files, main_file), pdf)
+
+    def _release(self, workspace_id: str) -> None:
+        """Stop ``workspace_id`` waiting on its previous content."""
+        timer = self._timers.pop(workspace_id, None)
+        if timer is not None:
+            timer.cancel()
+        key = self._pending.pop(workspace_id, None)
+        if key is None:
+            return
+
+        waiters = self._waiters.get(key, set())
+        waiters.discard(workspace_id)
+        if not waiters:
+            self._waiters.pop(key, None)
+            self._queued.pop(key, None)
+
+    def _forget(self, key: str) -> None:
+        """Stop every workspace waiting on ``key``; its PDF is handled elsewhere."""
+        for workspace_id in self._waiters.pop(key, set()):
+            if self._pending.get(workspace_id) == key:
+                del self._pending[workspace_id]
+                timer = self._timers.pop(workspace_id, None)
+                if timer is not None:
+                    timer.cancel()
+
+    def _submit(self, workspace_id: str, key: str, files: list[dict], main_file: str) -> None:
+        with self._lock:
+            if self._pending.get(workspace_id) != key:
+                return
+            self._timers.pop(workspace_id, None)
+            if key in self._in_flight or key in self._queued:
+                return
+            if key in self._results or self._executor is None:
+                self._release(workspace_id)
+                return
+
+            self._queued[key] = (files, main_file)
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand queued builds to the pool while workers are free."""
+        with self._lock:
+            restarted = False
+            while self._executor is not None and self._queued \
+                    and len(self._in_flight) < self.max_workers:
+                key, (files, main_file) = self._queued.popitem(last=False)
+                try:
+                    future = self._executor.submit(self.build, files, main_file)
+                except (BrokenProcessPool, RuntimeError) as e:
+                    print(f"Speculative PDF pool unavailable: {str(e)}")
+                    if restarted:
+                        self._forget(key)
+                        return
+                    # Retry this build once on a fresh pool
+                    self._queued[key] = (files, main_file)
+                    self._queued.move_to_end(key, last=False)
+                    self._restart_pool()
+                    restarted = True
+                    continue
+                self._in_flight[key] = future
+                future.add_done_callback(
+                    lambda f, key=key, generation=self._generation: self._finished(key, f, generation)
+                )
+
+    def _restart_pool(self) -> None:
+        """Replace a broken pool; builds that were running on it are lost."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._make_executor()
+            self._generation += 1
+
+    def _finished(self, key: str, future: Future[bytes], generation: int) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            self._forget(key)
+
+        try:
+            self._store(key, future.result())
+        except BrokenProcessPool as e:
+            print(f"Speculative PDF worker died: {str(e)}")
+            with self._lock:
+                if generation == self._generation:
+                    self._restart_pool()
+        except Exception as e:
+            print(f"Speculative PDF build failed: {str(e)}")
+        self._dispatch()
+
+    def _store(self, key: str, pdf: bytes) -> None:
+        with self._lock:
+            self._results[key] = pdf
+            self._results.move_to_end(key)
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
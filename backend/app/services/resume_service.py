@@ -1,5 +1,3 @@
-from codecs import ignore_errors
-from weasyprint import HTML, CSS
 from io import BytesIO
 import os
 import shutil
@@ -8,9 +6,9 @@ import tempfile
 
 # Try to import WeasyPrint, but don't fail if it's not available
 try:
-    from weasyprint import HTML, CSS
+    import weasyprint
     WEASYPRINT_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):
     WEASYPRINT_AVAILABLE = False
 
 
@@ -28,6 +26,7 @@ class ResumeService:
         """ Export HTML to PDF using Weasyprint (if available) """
         if not WEASYPRINT_AVAILABLE:
             raise Exception('Weasyprint is not available')
+        from weasyprint import HTML, CSS
 
         temp_dir = tempfile.mkdtemp()
         try:
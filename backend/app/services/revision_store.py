@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Optional
+
+
+class RevisionNotFoundError(Exception):
+    pass
+
+
+def get_revision_store() -> 'RevisionStore':
+    """Return the store created for the current app in ``create_app``."""
+    from flask import current_app
+    return current_app.extensions['revision_store']
+
+
+def validate_workspace_payload(payload: dict) -> None:
+    """Raise ``ValueError`` unless ``files``, ``deleted`` and ``revisionId`` are well formed."""
+    files = payload.get('files')
+    if files is not None:
+        if not isinstance(files, list):
+            raise ValueError('files must be a list')
+        for file in files:
+            if not isinstance(file, dict) or not isinstance(file.get('path'), str) \
+                    or not isinstance(file.get('content'), str):
+                raise ValueError('Each file must have a string path and content')
+
+    deleted = payload.get('deleted')
+    if deleted is not None and (not isinstance(deleted, list)
+                                or not all(isinstance(p, str) for p in deleted)):
+        raise ValueError('deleted must be a list of paths')
+
+    revision_id = payload.get('revisionId')
+    if revision_id is not None and not isinstance(revision_id, str):
+        raise ValueError('revisionId must be a string')
+
+
+class RevisionStore:
+    """Content-addressed store for workspace files.
+
+    File contents are stored once per unique content as zlib-compressed blobs
+    keyed by their SHA-256. A revision is a manifest mapping each path to its
+    file metadata and blob hash; its ID is the hash of that manifest, so
+    identical workspaces always share the same revision ID.
+
+    Revisions that have not been created or used as a base for
+    ``retention_seconds`` are pruned, along with blobs no remaining revision
+    refers to.
+    """
+
+    def __init__(self, db_path: str, retention_seconds: float = 30 * 24 * 3600,
+                 prune_interval: float = 3600):
+        self.db_path = db_path
+        self.retention_seconds = retention_seconds
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self._prune_lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS blobs ('
+                'hash TEXT PRIMARY KEY, data BLOB NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS revisions ('
+                'id TEXT PRIMARY KEY, parent TEXT, manifest TEXT NOT NULL, '
+                'created_at REAL NOT NULL, last_used_at REAL NOT NULL)'
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _put_blob(self, conn: sqlite3.Connection, content: str) -> str:
+        blob_hash = self.hash_content(content)
+        conn.execute(
+            'INSERT OR IGNORE INTO blobs (hash, data) VALUES (?, ?)',
+            (blob_hash, zlib.compress(content.encode('utf-8'))),
+        )
+        return blob_hash
+
+    def _get_blob(self, conn: sqlite3.Connection, blob_hash: str) -> str:
+        row = conn.execute('SELECT data FROM blobs WHERE hash = ?', (blob_hash,)).fetchone()
+        if row is None:
+            raise RevisionNotFoundError(f'Blob {blob_hash} not found')
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def _get_manifest(self, conn: sqlite3.Connection, revision_id: str) -> dict[str, dict]:
+        row = conn.execute('SELECT manifest FROM revisions WHERE id = ?', (revision_id,)).fetchone()
+        if row is None:
+            raise RevisionNotFoundError(f'Revision {revision_id} not found')
+        return json.loads(row[0])
+
+    def create_revision(self, files: list[dict], base_id: Optional[str] = None,
+                        deleted: Optional[list[str]] = None) -> str:
+        """Store a revision and return its ID.
+
+        With ``base_id``, ``files`` only needs to contain added or changed
+        files; everything else is carried over from the base revision, minus
+        any paths listed in ``deleted``.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            # Take the write lock up front so a concurrent prune cannot drop
+            # the base revision's blobs between reading and referencing them
+            conn.execute('BEGIN IMMEDIATE')
+            manifest = self._get_manifest(conn, base_id) if base_id else {}
+            for path in deleted or []:
+                manifest.pop(path, None)
+            for file in files:
+                entry = {**manifest.get(file['path'], {}),
+                         **{k: v for k, v in file.items() if k != 'content'}}
+                entry['blob'] = self._put_blob(conn, file['content'])
+                manifest[file['path']] = entry
+
+            encoded = json.dumps(manifest, sort_keys=True, separators=(',', ':'))
+            revision_id = hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+            conn.execute(
+                'INSERT OR IGNORE INTO revisions (id, parent, manifest, created_at, last_used_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (revision_id, base_id, encoded, now, now),
+            )
+            conn.execute(
+                'UPDATE revisions SET last_used_at = ? WHERE id IN (?, ?)',
+                (now, revision_id, base_id),
+            )
+
+        self._maybe_prune()
+        return revision_id
+
+    def _maybe_prune(self) -> None:
+        """Prune in the background once ``prune_interval`` has passed."""
+        if time.monotonic() - self._last_prune <= self.prune_interval:
+            return
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        self._last_prune = time.monotonic()
+
+        def run():
+            try:
+                self.prune()
+            except sqlite3.Error as e:
+                print(f"Revision prune failed: {str(e)}")
+            finally:
+                self._prune_lock.release()
+
+        threading.Thread(target=run, name='revision-prune', daemon=True).start()
+
+    def get_files(self, revision_id: str) -> list[dict]:
+        """Return the full file list of a revision in the client's format."""
+        with self._connect() as conn:
+            manifest = self._get_manifest(conn, revision_id)
+            files = []
+            for entry in manifest.values():
+                file = {k: v for k, v in entry.items() if k != 'blob'}
+                file['content'] = self._get_blob(conn, entry['blob'])
+                files.append(file)
+            return files
+
+    def history(self, revision_id: str, limit: int = 50) -> list[dict]:
+        """Walk the parent chain starting from ``revision_id``."""
+        entries = []
+        with self._connect() as conn:
+            current = revision_id
+            while current and len(entries) < limit:
+                row = conn.execute(
+                    'SELECT parent, manifest, created_at FROM revisions WHERE id = ?',
+                    (current,),
+                ).fetchone()
+                if row is None:
+                    if not entries:
+                        raise RevisionNotFoundError(f'Revision {revision_id} not found')
+                    break
+                parent, manifest, created_at = row
+                entries.append({
+                    'id': current,
+                    'parent': parent,
+                    'paths': sorted(json.loads(manifest)),
+                    'createdAt': created_at,
+                })
+                current = parent
+        return entries
+
+    def prune(self, now: Optional[float] = None) -> tuple[int, int]:
+        """Drop expired revisions and unreferenced blobs.
+
+        Returns the number of revisions and blobs deleted.
+        """
+        cutoff = (now if now is not None else time.time()) - self.retention_seconds
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            revisions = conn.execute('DELETE FROM revisions WHERE last_used_at < ?', (cutoff,)).rowcount
+
+            referenced = set()
+            for (manifest,) in conn.execute('SELECT manifest FROM revisions'):
+                referenced.update(entry['blob'] for entry in json.loads(manifest).values())
+            orphans = [(h,) for (h,) in conn.execute('SELECT hash FROM blobs') if h not in referenced]
+            conn.executemany('DELETE FROM blobs WHERE hash = ?', orphans)
+        return revisions, len(orphans)
+
+    def resolve(self, files: list[dict], base_id: str,
+                deleted: Optional[list[str]] = None) -> list[dict]:
+        """Apply changes to a base revision in memory, without storing anything."""
+        merged = {f['path']: f for f in self.get_files(base_id)}
+        for path in deleted or []:
+            merged.pop(path, None)
+        for file in files:
+            merged[file['path']] = {**merged.get(file['path'], {}), **file}
+        return list(merged.values())
+
+    def checkout(self, payload: dict, persist: bool = False) -> tuple[Optional[str], list[dict]]:
+        """Resolve the workspace described by a request body.
+
+        Accepts either a full ``files`` array, or a ``revisionId`` plus only
+        the changed ``files`` and any ``deleted`` paths. The result is only
+        stored when ``persist`` is set; otherwise it is resolved in memory and
+        yields no ID, which keeps frequent requests like previews read-only.
+        Returns the revision ID (or ``None``) and the full file list.
+        """
+        validate_workspace_payload(payload)
+        files = payload.get('files') or []
+        base_id = payload.get('revisionId')
+        if not persist:
+            if not base_id:
+                return None, files
+            return None, self.resolve(files, base_id, deleted=payload.get('deleted'))
+
+        revision_id = self.create_revision(files, base_id=base_id, deleted=payload.get('deleted'))
+        if not base_id:
+            # Keep the client's ordering when it already sent everything
+            return revision_id, files
+        return revision_id, self.get_files(revision_id)
@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+import runpy
+import signal
+import time
+
+import pytest
+
+import app as app_package
+from app.services.pdf_prerenderer import PdfPrerenderer
+
+SLOW_SECONDS = 1.0
+
+
+def fake_build(files, main_file):
+    content = files[0]['content']
+    if content == 'crash':
+        os.kill(os.getpid(), signal.SIGKILL)
+    if content.startswith('slow'):
+        time.sleep(SLOW_SECONDS)
+    return content.encode('utf-8')
+
+
+def workspace(content):
+    return [{'path': 'index.html', 'content': content}]
+
+
+def wait_for(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def prepare(prerenderer, workspace_id, content, timeout=20.0):
+    prerenderer.schedule(workspace_id, workspace(content))
+    return wait_for(lambda: prerenderer.state(workspace(content)) == 'ready', timeout)
+
+
+@pytest.fixture
+def prerenderer():
+    prerenderer = PdfPrerenderer(enabled=True, idle_seconds=0.05, max_workers=1, build=fake_build)
+    # Start the worker process up front so timings below are about builds
+    assert prepare(prerenderer, 'warm-up', 'warm-up')
+    return prerenderer
+
+
+def test_disabled_does_nothing():
+    prerenderer = PdfPrerenderer(enabled=False)
+    prerenderer.schedule('a', workspace('one'))
+    assert prerenderer.state(workspace('one')) is None
+    assert prerenderer.get(workspace('one')) is None
+
+
+def test_newer_edit_replaces_pending_build(prerenderer):
+    prerenderer.schedule('a', workspace('one'))
+    prerenderer.schedule('a', workspace('two'))
+
+    assert wait_for(lambda: prerenderer.state(workspace('two')) == 'ready')
+    assert prerenderer.get(workspace('two')) == b'two'
+    assert prerenderer.state(workspace('one')) is None
+
+
+def test_shared_content_survives_one_workspace_moving_on(prerenderer):
+    prerenderer.schedule('a', workspace('shared'))
+    prerenderer.schedule('b', workspace('shared'))
+    prerenderer.schedule('a', workspace('other'))
+
+    assert wait_for(lambda: prerenderer.state(workspace('shared')) == 'ready')
+    assert prerenderer.get(workspace('shared')) == b'shared'
+
+
+def test_get_waits_only_for_running_build(prerenderer):
+    prerenderer.schedule('a', workspace('slow-first'))
+    assert wait_for(lambda: prerenderer.state(workspace('slow-first')) == 'running')
+    prerenderer.schedule('b', workspace('second'))
+    assert wait_for(lambda: prerenderer.state(workspace('second')) == 'queued')
+
+    # Queued behind another workspace: dropped so export can build inline
+    started = time.monotonic()
+    assert prerenderer.get(workspace('second')) is None
+    assert time.monotonic() - started < SLOW_SECONDS / 2
+    assert prerenderer.state(workspace('second')) is None
+
+    # Already running: waiting beats starting over
+    assert prerenderer.get(workspace('slow-first')) == b'slow-first'
+
+
+def test_get_gives_up_on_a_slow_build(prerenderer):
+    prerenderer.wait_seconds = 0.1
+    prerenderer.schedule('a', workspace('slow-stuck'))
+    assert wait_for(lambda: prerenderer.state(workspace('slow-stuck')) == 'running')
+
+    started = time.monotonic()
+    assert prerenderer.get(workspace('slow-stuck')) is None
+    assert time.monotonic() - started < SLOW_SECONDS / 2
+
+
+def test_recovers_from_worker_killed_mid_build(prerenderer):
+    prerenderer.schedule('a', workspace('crash'))
+    assert prerenderer.state(workspace('crash')) == 'waiting'
+    assert wait_for(lambda: prerenderer.state(workspace('crash')) is None)
+
+    assert prepare(prerenderer, 'a', 'after-crash')
+
+
+def test_recovers_from_idle_worker_killed(prerenderer):
+    for process in multiprocessing.active_children():
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+    # The first build after the kill may still hit the dead pool
+    assert prepare(prerenderer, 'a', 'after-kill', timeout=5) \
+        or prepare(prerenderer, 'b', 'after-kill')
+
+
+def test_spawned_workers_do_not_build_the_app(monkeypatch):
+    def fail():
+        raise AssertionError('create_app called while importing app.py')
+
+    monkeypatch.setattr(app_package, 'create_app', fail)
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+    runpy.run_path(script, run_name='__mp_main__')
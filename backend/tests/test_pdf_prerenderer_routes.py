@@ -0,0 +1,45 @@
+import pytest
+
+from app import create_app
+
+FILES = [{'path': 'index.html', 'content': '<html><body><p>one</p></body></html>'}]
+
+
+@pytest.fixture
+def app(tmp_path):
+    return create_app({
+        'REVISION_STORE_PATH': str(tmp_path / 'revisions.db'),
+        'PDF_PRERENDER_ENABLED': True,
+    })
+
+
+@pytest.fixture
+def scheduled(app, monkeypatch):
+    calls = []
+    prerenderer = app.extensions['pdf_prerenderer']
+    monkeypatch.setattr(prerenderer, 'schedule', lambda *args: calls.append(args))
+    return calls
+
+
+def test_create_app_configures_prerenderer(app):
+    assert app.extensions['pdf_prerenderer'].enabled
+
+
+def test_render_schedules_only_with_workspace_id(app, scheduled):
+    client = app.test_client()
+
+    client.post('/render', json={'files': FILES})
+    client.post('/render', json={'files': FILES, 'workspaceId': ''})
+    assert scheduled == []
+
+    client.post('/render', json={'files': FILES, 'workspaceId': 'tab-1'})
+    assert scheduled == [('tab-1', FILES, 'index.html')]
+
+
+def test_export_serves_prepared_pdf(app):
+    app.extensions['pdf_prerenderer'].put(FILES, 'index.html', b'%PDF-prepared')
+
+    response = app.test_client().post('/export-pdf', json={'files': FILES})
+    assert response.status_code == 200
+    assert response.data == b'%PDF-prepared'
+    assert response.headers['X-Revision-Id']
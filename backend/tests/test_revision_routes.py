@@ -0,0 +1,64 @@
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture
+def client(tmp_path):
+    app = create_app({'REVISION_STORE_PATH': str(tmp_path / 'revisions.db')})
+    return app.test_client()
+
+
+FILES = [
+    {'path': 'index.html', 'content': '<html><body><p>one</p></body></html>'},
+    {'path': 'style.css', 'content': 'p { color: red; }'},
+]
+
+
+def test_render_resolves_delta_without_storing(client):
+    revision_id = client.post('/revisions', json={'files': FILES}).get_json()['revisionId']
+
+    for i in range(3):
+        response = client.post('/render', json={
+            'revisionId': revision_id,
+            'files': [{'path': 'index.html', 'content': f'<html><body><p>{i}</p></body></html>'}],
+            'deleted': ['style.css'],
+        })
+        data = response.get_json()
+        assert response.status_code == 200
+        assert f'<p>{i}</p>' in data['html']
+        assert data['css_files'] == {}
+        assert 'revisionId' not in data
+
+    history = client.get(f'/revisions/{revision_id}/history').get_json()['history']
+    assert [entry['id'] for entry in history] == [revision_id]
+
+
+def test_render_full_files_is_not_persisted(client):
+    data = client.post('/render', json={'files': FILES}).get_json()
+    assert 'revisionId' not in data
+    assert data['css_files'] == {'style.css': 'p { color: red; }'}
+
+
+def test_unknown_revision_returns_410(client):
+    for url in ('/render', '/export-pdf', '/revisions'):
+        response = client.post(url, json={'revisionId': 'nope', 'files': []})
+        assert response.status_code == 410
+        assert response.get_json()['code'] == 'revision_not_found'
+    assert client.get('/revisions/nope').status_code == 410
+
+
+def test_missing_ai_edit_target_is_not_a_missing_revision(client):
+    response = client.post('/ai-edit', json={
+        'apiKey': 'key', 'targetPath': 'missing.html', 'instruction': 'x', 'files': FILES,
+    })
+    assert response.status_code == 404
+    assert 'code' not in response.get_json()
+
+
+@pytest.mark.parametrize('files', ['index.html', [{'path': 'index.html'}]])
+def test_malformed_files_return_json_400(client, files):
+    for url in ('/render', '/export-pdf', '/revisions'):
+        response = client.post(url, json={'files': files})
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
@@ -0,0 +1,116 @@
+import pytest
+
+from app.services.revision_store import RevisionNotFoundError, RevisionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RevisionStore(str(tmp_path / 'revisions.db'))
+
+
+BASE_FILES = [
+    {'name': 'index.html', 'path': 'index.html', 'content': '<p>one</p>', 'fileType': 'regular'},
+    {'name': 'style.css', 'path': 'style.css', 'content': 'p { color: red; }', 'fileType': 'regular'},
+]
+
+
+def by_path(files):
+    return {f['path']: f for f in files}
+
+
+def test_delta_on_top_of_base(store):
+    base_id = store.create_revision(BASE_FILES)
+    child_id = store.create_revision([{'path': 'index.html', 'content': '<p>two</p>'}], base_id=base_id)
+
+    files = by_path(store.get_files(child_id))
+    assert files['index.html']['content'] == '<p>two</p>'
+    # Metadata not resent with the delta is carried over from the base
+    assert files['index.html']['name'] == 'index.html'
+    assert files['style.css']['content'] == 'p { color: red; }'
+    assert by_path(store.get_files(base_id))['index.html']['content'] == '<p>one</p>'
+
+
+def test_deleted_paths(store):
+    base_id = store.create_revision(BASE_FILES)
+    child_id = store.create_revision([], base_id=base_id, deleted=['style.css', 'missing.css'])
+
+    assert list(by_path(store.get_files(child_id))) == ['index.html']
+
+
+def test_identical_content_shares_id(store):
+    first = store.create_revision(BASE_FILES)
+    second = store.create_revision(list(reversed(BASE_FILES)))
+    via_delta = store.create_revision(
+        [{'path': 'style.css', 'content': 'p { color: red; }'}],
+        base_id=store.create_revision(BASE_FILES[:1]),
+    )
+    assert first == second
+    assert store.create_revision([], base_id=first) == first
+    # Same paths and contents, but style.css lacks the name/fileType metadata
+    assert via_delta != first
+
+
+def test_unknown_base_raises(store):
+    with pytest.raises(RevisionNotFoundError):
+        store.create_revision([], base_id='nope')
+    with pytest.raises(RevisionNotFoundError):
+        store.checkout({'revisionId': 'nope', 'files': []})
+
+
+def test_history_order_and_limit(store):
+    ids = [store.create_revision(BASE_FILES)]
+    for i in range(3):
+        ids.append(store.create_revision([{'path': 'index.html', 'content': f'<p>{i}</p>'}], base_id=ids[-1]))
+
+    history = store.history(ids[-1])
+    assert [entry['id'] for entry in history] == list(reversed(ids))
+    assert history[-1]['parent'] is None
+    assert [entry['id'] for entry in store.history(ids[-1], limit=2)] == [ids[3], ids[2]]
+    with pytest.raises(RevisionNotFoundError):
+        store.history('nope')
+
+
+def test_checkout_only_stores_when_persisting(store):
+    revision_id, files = store.checkout({'files': BASE_FILES})
+    assert revision_id is None
+    assert files == BASE_FILES
+
+    revision_id, _ = store.checkout({'files': BASE_FILES}, persist=True)
+    delta = {'revisionId': revision_id, 'files': [{'path': 'index.html', 'content': '<p>two</p>'}],
+             'deleted': ['style.css']}
+
+    resolved_id, files = store.checkout(delta)
+    assert resolved_id is None
+    assert files == [{**BASE_FILES[0], 'content': '<p>two</p>'}]
+    assert len(store.history(revision_id)) == 1
+
+    child_id, persisted = store.checkout(delta, persist=True)
+    assert persisted == files
+    assert store.history(child_id)[1]['id'] == revision_id
+
+
+@pytest.mark.parametrize('payload', [
+    {'files': 'index.html'},
+    {'files': [{'path': 'index.html'}]},
+    {'files': [['index.html', '']]},
+    {'files': [], 'deleted': 'style.css'},
+    {'files': [], 'revisionId': 5},
+])
+def test_checkout_rejects_malformed_payload(store, payload):
+    with pytest.raises(ValueError):
+        store.checkout(payload, persist=True)
+
+
+def test_prune_drops_stale_revisions_and_orphan_blobs(store):
+    old_id = store.create_revision([{'path': 'old.html', 'content': 'old'}])
+    keep_id = store.create_revision(BASE_FILES)
+
+    revisions, blobs = store.prune(now=store.history(keep_id)[0]['createdAt'] + store.retention_seconds - 1)
+    assert (revisions, blobs) == (0, 0)
+
+    with store._connect() as conn:
+        conn.execute('UPDATE revisions SET last_used_at = 0 WHERE id = ?', (old_id,))
+    assert store.prune() == (1, 1)
+    with pytest.raises(RevisionNotFoundError):
+        store.get_files(old_id)
+    assert len(store.get_files(keep_id)) == 2
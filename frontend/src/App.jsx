@@ -1,6 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react';
 import Editor from '@monaco-editor/react';
-import axios from 'axios';
 import FileExplorer from './components/FileExplorer';
 import AIEdit from './components/AIEdit';
 import './App.css';
@@ -9,6 +8,8 @@ import ResumeUploader from './components/ResumeUploader';
 import { generateDirectEditScript, handleContentUpdate } from './components/DirectTextEditor';
 import { initialFiles, initialJobDesc, newCssContent, newHtmlContent } from './data/initialFiles';
 import Toolbar from './components/Toolbar';
+import { postWorkspace } from './services/revisions';
+import { getWorkspaceId } from './services/workspace';
 
 // Backend URL configuration
 const BACKEND_URL = 'http://localhost:5001';
@@ -123,9 +124,9 @@ function App() {
       // Filter out job description files for rendering
       const renderableFiles = files.filter(f => f.fileType !== 'job-description');
 
-      const response = await axios.post(`${BACKEND_URL}/render`, {
-        files: renderableFiles,
-        mainFile: 'index.html'
+      const response = await postWorkspace(BACKEND_URL, '/render', renderableFiles, {
+        mainFile: 'index.html',
+        workspaceId: getWorkspaceId()
       });
 
       // Use the direct edit script from the imported component
@@ -1,5 +1,5 @@
 import React, { useState, useRef, useEffect } from 'react';
-import axios from 'axios';
+import { postWorkspace } from '../services/revisions';
 import './AIEdit.css';
 
 const AIEdit = ({
@@ -32,8 +32,8 @@ const AIEdit = ({
 
     try {
       const selector = generateSelector(selectedElement);
-      const response = await axios.post('http://localhost:5001/ai-edit', {
-        apiKey, model: aiModel, targetPath, selector, instruction, files
+      const response = await postWorkspace('http://localhost:5001', '/ai-edit', files, {
+        apiKey, model: aiModel, targetPath, selector, instruction
       });
 
       if (response.data.success && response.data.updatedFiles) {
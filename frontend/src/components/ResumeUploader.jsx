@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import axios from 'axios';
+import { postWorkspaceForm } from '../services/revisions';
 import './ResumeUploader.css';
 
 const ResumeUploader = ({ files, apiKey, aiModel, onUpdate, onClose }) => {
@@ -33,15 +33,13 @@ const ResumeUploader = ({ files, apiKey, aiModel, onUpdate, onClose }) => {
     setError(null);
     setProgress(10);
     
-    const formData = new FormData();
-    formData.append('file', file);
-    formData.append('apiKey', apiKey);
-    formData.append('model', aiModel);
-    formData.append('files', JSON.stringify(files));
-    
     try {
       setProgress(30);
-      const response = await axios.post('http://localhost:5001/upload-resume', formData, {
+      const response = await postWorkspaceForm('http://localhost:5001', '/upload-resume', files, {
+        file,
+        apiKey,
+        model: aiModel
+      }, {
         headers: {
           'Content-Type': 'multipart/form-data'
         },
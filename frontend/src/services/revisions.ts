@@ -0,0 +1,98 @@
+import axios, { AxiosRequestConfig, AxiosResponse } from "axios";
+
+type WorkspaceFile = { path: string; content: string; [key: string]: any };
+
+// Last revision the backend confirmed, with the contents it was built from
+let baseRevision: { id: string; contents: Map<string, string> } | null = null;
+
+export const recordRevision = (revisionId: string | null | undefined, files: WorkspaceFile[]) => {
+  if (revisionId) {
+    baseRevision = { id: revisionId, contents: new Map(files.map(f => [f.path, f.content])) };
+  }
+};
+
+const ensureBaseRevision = async (files: WorkspaceFile[], BACKEND_URL: string) => {
+  if (!baseRevision) {
+    const response = await axios.post(`${BACKEND_URL}/revisions`, { files });
+    recordRevision(response.data.revisionId, files);
+  }
+  return baseRevision!;
+};
+
+// Only send what changed since the base revision
+const buildDelta = (files: WorkspaceFile[]) => {
+  const base = baseRevision!;
+  const paths = new Set(files.map(f => f.path));
+  return {
+    revisionId: base.id,
+    files: files.filter(f => base.contents.get(f.path) !== f.content),
+    deleted: [...base.contents.keys()].filter(path => !paths.has(path)),
+  };
+};
+
+type RevisionDelta = ReturnType<typeof buildDelta>;
+
+// The backend answers 410 only when it no longer has the base revision
+const isRevisionGone = (response?: AxiosResponse) => response?.status === 410;
+
+/**
+ * Send a workspace as a delta on top of the last known revision.
+ * Falls back to re-uploading the full workspace once if the server no longer has that revision.
+ */
+const sendWithRevision = async (
+  BACKEND_URL: string,
+  files: WorkspaceFile[],
+  send: (delta: RevisionDelta) => Promise<AxiosResponse>
+): Promise<AxiosResponse> => {
+  const attempt = async () => {
+    await ensureBaseRevision(files, BACKEND_URL);
+    return send(buildDelta(files));
+  };
+
+  let response: AxiosResponse | null = null;
+  try {
+    response = await attempt();
+  } catch (err: any) {
+    if (!isRevisionGone(err.response)) throw err;
+  }
+  if (!response || isRevisionGone(response)) {
+    baseRevision = null;
+    response = await attempt();
+  }
+
+  // Stored revisions become the new base; AI routes return the edited workspace,
+  // everything else stores what was sent
+  recordRevision(
+    response.data?.revisionId ?? response.headers['x-revision-id'],
+    response.data?.updatedFiles ?? files
+  );
+  return response;
+};
+
+export const postWorkspace = (
+  BACKEND_URL: string,
+  endpoint: string,
+  files: WorkspaceFile[],
+  body: Record<string, any> = {},
+  config: AxiosRequestConfig = {}
+): Promise<AxiosResponse> =>
+  sendWithRevision(BACKEND_URL, files, delta =>
+    axios.post(`${BACKEND_URL}${endpoint}`, { ...body, ...delta }, config)
+  );
+
+// Multipart variant for endpoints that also take an uploaded file
+export const postWorkspaceForm = (
+  BACKEND_URL: string,
+  endpoint: string,
+  files: WorkspaceFile[],
+  fields: Record<string, string | Blob>,
+  config: AxiosRequestConfig = {}
+): Promise<AxiosResponse> =>
+  sendWithRevision(BACKEND_URL, files, delta => {
+    const formData = new FormData();
+    Object.entries(fields).forEach(([name, value]) => formData.append(name, value));
+    formData.append('revisionId', delta.revisionId);
+    formData.append('files', JSON.stringify(delta.files));
+    formData.append('deleted', JSON.stringify(delta.deleted));
+    return axios.post(`${BACKEND_URL}${endpoint}`, formData, config);
+  });
@@ -1,4 +1,4 @@
-import axios from "axios";
+import { postWorkspace } from "./revisions";
 
 export const exportPdf = async (files: any, setIsRendering: any, setError: any, BACKEND_URL: string) => {
   try {
@@ -9,9 +9,11 @@ export const exportPdf = async (files: any, setIsRendering: any, setError: any,
     const renderableFiles = files.filter((f: any) => f.fileType !== 'job-description');
 
     // Generate PDF
-    const response = await axios.post(
-      `${BACKEND_URL}/export-pdf`,
-      { files: renderableFiles, mainFile: 'index.html' },
+    const response = await postWorkspace(
+      BACKEND_URL,
+      '/export-pdf',
+      renderableFiles,
+      { mainFile: 'index.html' },
       { responseType: 'blob', validateStatus: status => status < 600 }
     );
 
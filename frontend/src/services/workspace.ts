@@ -0,0 +1,12 @@
+// Identifies this tab's workspace to the backend, e.g. for background PDF pre-rendering
+export const getWorkspaceId = (): string => {
+  let workspaceId = sessionStorage.getItem('workspace_id');
+  if (!workspaceId) {
+    // randomUUID is only available in secure contexts
+    workspaceId = typeof crypto.randomUUID === 'function'
+      ? crypto.randomUUID()
+      : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+    sessionStorage.setItem('workspace_id', workspaceId);
+  }
+  return workspaceId;
+};